@@ -1,41 +1,118 @@
-import functools
 import typing as t
-import inspect
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
 from sqlalchemy import inspect as sql_inspect
 
 
-def get_sql_field_names(model_instance) -> t.Set[str]:
+@dataclass(slots=True, frozen=True)
+class _ClassPlan:
+    """
+    Per-class field layout computed once on first use
+    """
+
+    sql_fields: t.FrozenSet[str]
+    property_fields: t.FrozenSet[str]
+
+
+_PLANS: "WeakKeyDictionary[type, _ClassPlan]" = WeakKeyDictionary()
+
+# Properties do not need SQLAlchemy inspection,
+# so they are cached separately to serve any class
+_PROPERTY_FIELDS: "WeakKeyDictionary[type, t.FrozenSet[str]]" = WeakKeyDictionary()
+
+# Serializable keys depend only on the model class and its settings,
+# so they are cached once per class instead of once per instance
+_SERIALIZABLE_KEYS: "WeakKeyDictionary[type, dict]" = WeakKeyDictionary()
+
+
+def _collect_sql_field_names(cls) -> t.FrozenSet[str]:
+    return frozenset(a.key for a in sql_inspect(cls).mapper.attrs)
+
+
+def _collect_property_field_names(cls) -> t.Tuple[str, ...]:
+    seen = set()
+    names = []
+    for klass in cls.__mro__:
+        for name, member in vars(klass).items():
+            if name in seen:
+                continue  # Overridden in a subclass
+            seen.add(name)
+            if isinstance(member, property):
+                names.append(name)
+    return tuple(names)
+
+
+def get_class_property_field_names(cls) -> t.FrozenSet[str]:
+    """
+    :return: cached set of field names of the class defined as @property
+    """
+    names = _PROPERTY_FIELDS.get(cls)
+    if names is None:
+        names = _PROPERTY_FIELDS[cls] = frozenset(_collect_property_field_names(cls))
+    return names
+
+
+def get_class_plan(cls) -> _ClassPlan:
+    """
+    :return: cached field layout of the model class
+    :raise:  sqlalchemy.exc.NoInspectionAvailable
+    """
+    plan = _PLANS.get(cls)
+    if plan is None:
+        plan = _ClassPlan(
+            sql_fields=_collect_sql_field_names(cls),
+            property_fields=get_class_property_field_names(cls),
+        )
+        _PLANS[cls] = plan
+    return plan
+
+
+def get_sql_field_names(model_instance) -> t.FrozenSet[str]:
     """
     :return:  set of sql fields names
     :raise:  sqlalchemy.exc.NoInspectionAvailable
     """
-    inspector = sql_inspect(model_instance)
-    return {a.key for a in inspector.mapper.attrs}
+    return get_class_plan(type(model_instance)).sql_fields
 
 
-def get_property_field_names(model_instance) -> t.Set[str]:
+def get_property_field_names(model_instance) -> t.FrozenSet[str]:
     """
     :return: set of field names defined as @property
     """
-    cls = model_instance.__class__
-    return {
-        name for name, member in inspect.getmembers(cls) if isinstance(member, property)
-    }
+    return get_class_property_field_names(model_instance.__class__)
 
 
-@functools.lru_cache
-def get_serializable_keys(model_instance) -> t.Set[str]:
+def get_serializable_keys(model_instance) -> t.FrozenSet[str]:
     """
     :return: set of keys available for serialization
     :raise:  sqlalchemy.exc.NoInspectionAvailable if model_instance is not an sqlalchemy mapper
     """
+    cls = model_instance.__class__
+    cache_key = (
+        (
+            tuple(model_instance.serializable_keys)
+            if model_instance.serializable_keys
+            else None
+        ),
+        bool(model_instance.auto_serialize_properties),
+    )
+    cached = _SERIALIZABLE_KEYS.get(cls)
+    if cached is None:
+        cached = _SERIALIZABLE_KEYS[cls] = {}
+    try:
+        return cached[cache_key]
+    except KeyError:
+        pass
+
     if model_instance.serializable_keys:
-        result = set(model_instance.serializable_keys)
+        result = frozenset(model_instance.serializable_keys)
 
     else:
-        result = get_sql_field_names(model_instance)
+        plan = get_class_plan(type(model_instance))
+        result = plan.sql_fields
 
         if model_instance.auto_serialize_properties:
-            result.update(get_property_field_names(model_instance))
+            result = result.union(plan.property_fields)
 
+    cached[cache_key] = result
     return result
@@ -1,3 +1,4 @@
+import functools
 import logging
 from collections import defaultdict
 import typing as t
@@ -52,17 +53,38 @@ class Rule:
     DELIM = "."  # Delimiter to separate nested rules
     NEGATION = "-"  # Prefix for negative rules
 
+    __slots__ = ("is_negative", "keys")
+
     def __init__(self, rule: str):
-        self.is_negative = rule.startswith(self.NEGATION)
+        self.is_negative = rule[:1] == self.NEGATION
         rule = rule.replace(self.NEGATION, "")
         self.keys = rule.split(self.DELIM)
 
+    @staticmethod
+    def get(rule: str) -> "Rule":
+        """
+        Returns a shared parsed instance of the rule.
+        Rules are never mutated after parsing so they are safe to reuse
+        """
+        return _parse_rule(rule)
+
     def __repr__(self):
         prefix = self.NEGATION if self.is_negative else ""
         return f"{prefix}{self.DELIM.join(self.keys)}"
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_rule(raw: str) -> Rule:
+    return Rule(raw)
+
+
+# Shared stand-in for missing nodes, must never be mutated
+_EMPTY_TREE = Tree()
+
+
 class Schema:
+    __slots__ = ("_tree",)
+
     def __init__(self, tree: t.Optional[Tree] = None):
         self._tree = tree or Tree()
 
@@ -74,6 +96,25 @@ class Schema:
     def is_greedy(self) -> bool:
         return self._tree.is_greedy
 
+    @property
+    def excluded_keys(self) -> t.FrozenSet[str]:
+        """
+        Keys explicitly excluded from a greedy schema
+        """
+        return frozenset(
+            k for k, node in self._tree.items() if not node and node.to_exclude
+        )
+
+    @property
+    def includes_all(self) -> bool:
+        """
+        True if every key is included so keys need no checks
+        """
+        tree = self._tree
+        return tree.is_greedy and not any(
+            not node and node.to_exclude for node in tree.values()
+        )
+
     def update(self, extend=(), only=()):
         if extend:
             self.apply(rules=extend, is_greedy=True)
@@ -81,66 +122,117 @@ class Schema:
             self.apply(rules=only, is_greedy=False)
 
     def apply(self, rules, is_greedy):
+        is_debug = logger.isEnabledFor(logging.DEBUG)
         rules_tree = Tree()
         for raw in rules:
-            logger.debug("Checking rule:%s", raw)
-            rule = Rule(raw)
+            if is_debug:
+                logger.debug("Checking rule:%s", raw)
+            rule = Rule.get(raw)
 
             current = self._tree
-            chain = Tree()
-            chain.is_greedy = is_greedy
+            path = []  # Greediness of every node of the rule chain
 
             keys_num = len(rule.keys)
-            new = chain
             for i, k in enumerate(rule.keys):
                 is_last_key = keys_num == i + 1
                 parent = current
-                node = current.get(k, Tree())  # Does not create a new node
-                new = new[k]  # Creates a new node
+                node = current.get(k, _EMPTY_TREE)  # Does not create a new node
 
-                if not (is_last_key or rule.is_negative) and node.is_greedy:
-                    new.is_greedy = is_greedy
+                path.append(
+                    is_greedy
+                    if not (is_last_key or rule.is_negative) and node.is_greedy
+                    else True
+                )
 
                 if not node and node.to_exclude:
-                    logger.debug("Ignore rule:%s leaf excludes key:%s", raw, k)
+                    if is_debug:
+                        logger.debug("Ignore rule:%s leaf excludes key:%s", raw, k)
                     break
 
-                if rule.is_negative:
-                    new.to_exclude = True
-                else:
-                    new.to_include = True
-
                 if is_last_key:
                     if not parent.is_greedy:
-                        logger.debug(
-                            "Ignore rule:%s parent does not accept new rules", raw
-                        )
+                        if is_debug:
+                            logger.debug(
+                                "Ignore rule:%s parent does not accept new rules", raw
+                            )
                     elif rule.is_negative and node.to_include:
-                        logger.debug("Ignore rule:%s leaf includes key:%s", raw, k)
+                        if is_debug:
+                            logger.debug("Ignore rule:%s leaf includes key:%s", raw, k)
                     else:
+                        chain = build_chain(rule=rule, path=path, is_greedy=is_greedy)
                         merge_trees(rules_tree, chain)
                 else:
                     current = node  # Go deeper
 
         if rules_tree:
-            logger.debug("Updating tree with rules:%s is_greedy:%s", rules, is_greedy)
+            if is_debug:
+                logger.debug(
+                    "Updating tree with rules:%s is_greedy:%s", rules, is_greedy
+                )
             merge_trees(self._tree, rules_tree)
 
     def is_included(self, key: str) -> bool:
-        node = self._tree.get(key)
+        tree = self._tree
+        node = tree.get(key)
+        if node is None:
+            return tree.is_greedy
+        if tree.is_greedy:
+            return bool(node) or not node.to_exclude
+        return bool(node.to_include)
+
+    def compile(self) -> t.Callable[[str], bool]:
+        """
+        Returns the equivalent of is_included bound to the current state of the tree.
+        Should be called again after the schema is updated
+        """
+        tree = self._tree
+        if tree.is_greedy:
+            excluded = self.excluded_keys
+
+            def check(key: str, _excluded=excluded) -> bool:
+                return key not in _excluded
+
+            return check
+
+        included = frozenset(k for k, node in tree.items() if node.to_include)
+        return included.__contains__
+
+    def filter_keys(self, keys: t.AbstractSet[str]) -> t.AbstractSet[str]:
+        """
+        Same as checking every key with is_included
+        but done with set operations
+        """
         if self._tree.is_greedy:
-            if not node:
-                return node is None or not node.to_exclude
-            return True
-        else:
-            return bool(node is not None and node.to_include)
+            excluded = self.excluded_keys
+            return keys - excluded if excluded else keys
+        return keys & self.keys
 
     def fork(self, key: str) -> "Schema":
         return Schema(tree=self._tree[key])
 
 
+def build_chain(rule: Rule, path: t.List[bool], is_greedy: bool) -> Tree:
+    """
+    Materializes the rule as a single-branch tree.
+    Nodes are created only for rules that are actually merged
+    """
+    chain = Tree(is_greedy=is_greedy)
+    new = chain
+    for k, node_is_greedy in zip(rule.keys, path):
+        new = new[k]
+        new.is_greedy = node_is_greedy
+        if rule.is_negative:
+            new.to_exclude = True
+        else:
+            new.to_include = True
+    return chain
+
+
 def merge_trees(old: Tree, *trees):
     for tree in trees:
-        old.apply(tree)
-        for k in tree.keys():
-            merge_trees(old[k], tree[k])
+        stack = [(old, tree)]
+        while stack:
+            target, source = stack.pop()
+            target.apply(source)
+            for k, subtree in source.items():
+                stack.append((target[k], subtree))
@@ -1,10 +1,7 @@
-from .bytes import Bytes
 from .date import Date
 from .datetime import DateTime
 from .time import Time
-from .uuid import UUID
 from .decimal import Decimal
-from .enum import Enum
 
 
-__all__ = ["Bytes", "Date", "DateTime", "Decimal", "Time", "UUID", "Enum"]
+__all__ = ["Date", "DateTime", "Decimal", "Time"]
@@ -1,4 +1,6 @@
 class Base:
+    __slots__ = ()
+
     def __call__(self, value) -> str:
         raise NotImplementedError(
             f"Method should implement serialization logic for{value}"
@@ -1,17 +1,27 @@
 from datetime import datetime
+from operator import methodcaller
+import typing as t
 from .base import Base
 
 
 class DateTime(Base):
+    __slots__ = ("tzinfo", "str_format", "_format")
+
     def __init__(self, str_format: str = "%H:%M:%S", tzinfo=None) -> None:
         self.tzinfo = tzinfo
         self.str_format = str_format
+        self._format = get_formatter(str_format)
 
-    def __call__(self, value: datetime) -> str:
-        if self.tzinfo:
-            value = to_local_time(dt=value, tzinfo=self.tzinfo)
+        if tzinfo:
+            format_local = self._format
+
+            def format_in_tz(value: datetime) -> str:
+                return format_local(to_local_time(dt=value, tzinfo=tzinfo))
 
-        return format_dt(tpl=self.str_format, dt=value)
+            self._format = format_in_tz
+
+    def __call__(self, value: datetime) -> str:
+        return self._format(value)
 
 
 def to_local_time(dt: datetime, tzinfo) -> datetime:
@@ -19,7 +29,11 @@ def to_local_time(dt: datetime, tzinfo) -> datetime:
     return normalized.replace(tzinfo=None)
 
 
-def format_dt(dt, tpl=None) -> str:
+def get_formatter(tpl=None) -> t.Callable[[t.Any], str]:
+    """
+    Resolves the template once, ISO format is used if it is empty
+    :return: callable formatting date/time objects
+    """
     if not tpl:
-        return dt.isoformat()
-    return dt.strftime(tpl)
+        return methodcaller("isoformat")
+    return methodcaller("strftime", tpl)
@@ -3,8 +3,11 @@ from .base import Base
 
 
 class Decimal(Base):
-    def __init__(self, str_format: str = "%H:%M:%S") -> None:
+    __slots__ = ("str_format", "_format")
+
+    def __init__(self, str_format: str = "{}") -> None:
         self.str_format = str_format
+        self._format = str_format.format if str_format else str
 
     def __call__(self, value: decimal.Decimal) -> str:
-        return self.str_format.format(value)
+        return self._format(value)
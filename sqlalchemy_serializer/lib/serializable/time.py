@@ -1,11 +1,14 @@
 import datetime
-from .datetime import format_dt
+from .datetime import get_formatter
 from .base import Base
 
 
 class Time(Base):
+    __slots__ = ("str_format", "_format")
+
     def __init__(self, str_format: str = "%H:%M:%S") -> None:
         self.str_format = str_format
+        self._format = get_formatter(str_format)
 
     def __call__(self, value: datetime.time):
-        return format_dt(tpl=self.str_format, dt=value)
+        return self._format(value)
@@ -1,3 +1,4 @@
+import functools
 import uuid
 from datetime import datetime, date, time
 from decimal import Decimal
@@ -6,7 +7,8 @@ import logging
 import inspect
 from collections import namedtuple
 from collections.abc import Iterable
-from types import MethodType
+from operator import attrgetter
+from types import FunctionType, MethodType
 import typing as t
 
 from sqlalchemy_serializer.lib.fields import get_serializable_keys
@@ -19,6 +21,16 @@ logger = logging.getLogger("serializer")
 logger.setLevel(level="WARN")
 
 
+# Builtin collections checked before falling back to the slower Iterable ABC
+_CONCRETE_COLLECTIONS = (list, tuple, set, frozenset, dict)
+
+# Collections that can be iterated more than once
+_REITERABLE_COLLECTIONS = frozenset((list, tuple, set, frozenset))
+
+# Stand-in for instances without __dict__
+_NO_ATTRIBUTES: dict = {}
+
+
 class SerializerMixin:
     """
     Mixin for retrieving public fields of sqlAlchemy-model in json-compatible format
@@ -86,7 +98,31 @@ class SerializerMixin:
         :param tzinfo: datetime.tzinfo converts datetimes to local user timezone
         :return: data: dict
         """
-        s = Serializer(
+        opts = self.get_serializer_options(
+            date_format=date_format,
+            datetime_format=datetime_format,
+            time_format=time_format,
+            tzinfo=tzinfo,
+            decimal_format=decimal_format,
+            serialize_types=serialize_types,
+        )
+        s = Serializer(options=opts)
+        return s(self, only=only, extend=rules)
+
+    def get_serializer_options(
+        self,
+        date_format=None,
+        datetime_format=None,
+        time_format=None,
+        tzinfo=None,
+        decimal_format=None,
+        serialize_types=None,
+    ) -> "Options":
+        """
+        Returns options of serialization, passed values override defaults of the model
+        :return: Options
+        """
+        return Options(
             date_format=date_format or self.date_format,
             datetime_format=datetime_format or self.datetime_format,
             time_format=time_format or self.time_format,
@@ -94,7 +130,6 @@ class SerializerMixin:
             tzinfo=tzinfo or self.get_tzinfo(),
             serialize_types=serialize_types or self.serialize_types,
         )
-        return s(self, only=only, extend=rules)
 
 
 Options = namedtuple(
@@ -104,6 +139,16 @@ Options = namedtuple(
 
 
 class Serializer:
+    __slots__ = (
+        "serialization_depth",
+        "opts",
+        "serialize_types",
+        "callbacks_by_type",
+        "forkable_by_type",
+        "simple_types",
+        "schema",
+    )
+
     # Types that do nod need any serialization logic
     atomic_types = (
         int,
@@ -113,12 +158,22 @@ class Serializer:
         type(None),
     )
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        schema: t.Optional[Schema] = None,
+        options: t.Optional[Options] = None,
+        **kwargs,
+    ):
+        """
+        :param schema: schema to start serialization with
+        :param options: already built options, shared instead of kwargs
+        :param kwargs: fields of Options
+        """
         self.set_serialization_depth(0)
-        self.set_options(Options(**kwargs))
+        self.set_options(Options(**kwargs) if options is None else options)
         self.init_callbacks()
 
-        self.schema = Schema()
+        self.schema = Schema() if schema is None else schema
 
     def __call__(self, value, only=(), extend=()):
         """
@@ -130,7 +185,8 @@ class Serializer:
         """
         self.schema.update(only=only, extend=extend)
 
-        logger.debug("Call serializer for type:%s", get_type(value))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Call serializer for type:%s", get_type(value))
         return self.serialize(value)
 
     def set_serialization_depth(self, value: int):
@@ -143,9 +199,9 @@ class Serializer:
         """Initialize callbacks"""
         self.serialize_types = (
             *(self.opts.serialize_types or ()),
-            (self.atomic_types, lambda x: x),  # Should be checked before any other type
-            (bytes, serializable.Bytes()),
-            (uuid.UUID, serializable.UUID()),
+            (self.atomic_types, identity),  # Should be checked before any other type
+            (bytes, bytes.decode),
+            (uuid.UUID, str),
             (
                 time,  # Should be checked before datetime
                 serializable.Time(str_format=self.opts.time_format),
@@ -160,44 +216,67 @@ class Serializer:
             (Decimal, serializable.Decimal(str_format=self.opts.decimal_format)),
             (dict, self.serialize_dict),  # Should be checked before Iterable
             (Iterable, self.serialize_iter),
-            (Enum, serializable.Enum()),
+            (Enum, get_enum_value),
             (SerializerMixin, self.serialize_model),
         )
+        # Callbacks resolved from serialize_types by exact type of the value
+        self.callbacks_by_type = {}
+        # Results of is_forkable by exact type of the value
+        self.forkable_by_type = {}
+        # Atomic types that are not overridden by custom serialize_types
+        # and can be returned as is
+        self.simple_types = frozenset(
+            atomic_type
+            for atomic_type in self.atomic_types
+            if not any(
+                issubclass(atomic_type, types)
+                for types, _ in self.opts.serialize_types or ()
+            )
+        )
 
     @staticmethod
     def is_valid_callable(func) -> bool:
         """
         Determines objects that should be called before serialization
         """
-        if callable(func):
-            i = inspect.getfullargspec(func)
-            if (
-                i.args == ["self"]
-                and isinstance(func, MethodType)
-                and not any([i.varargs, i.varkw])
-            ):
-                return True
-            return not any([i.args, i.varargs, i.varkw])
-        return False
+        if not callable(func):
+            return False
+
+        is_method = isinstance(func, MethodType)
+        target = func.__func__ if is_method else func
+        if type(target) is not FunctionType:
+            return inspect_callable(func)  # Not a plain function, nothing to cache on
+
+        return inspect_function(target, is_method=is_method)
 
     def is_forkable(self, value):
         """
         Determines if object should be processed in a separate serializer
         """
-        return not isinstance(value, str) and isinstance(
-            value, (Iterable, dict, SerializerMixin)
-        )
+        try:
+            return self.forkable_by_type[type(value)]
+        except KeyError:
+            pass
+
+        if isinstance(value, _CONCRETE_COLLECTIONS):
+            result = True
+        else:
+            result = not isinstance(value, str) and isinstance(
+                value, (Iterable, dict, SerializerMixin)
+            )
+        self.forkable_by_type[type(value)] = result
+        return result
 
     def fork(self, key: str) -> "Serializer":
         """
         Return new serializer for a key
         :return: serializer
         """
-        serializer = Serializer(**self.opts._asdict())
+        serializer = Serializer(options=self.opts, schema=self.schema.fork(key=key))
         serializer.set_serialization_depth(self.serialization_depth + 1)
-        serializer.schema = self.schema.fork(key=key)
 
-        logger.debug("Fork serializer for key:%s", key)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fork serializer for key:%s", key)
         return serializer
 
     def serialize(self, value, **kwargs):
@@ -212,15 +291,20 @@ class Serializer:
         Returns:
             The serialized value.
         """
+        if kwargs and "key" not in kwargs:
+            raise ValueError("Malformed structure of kwargs. Only `key` accepted")
+
+        if type(value) in self.simple_types:
+            return value  # Neither callable nor forkable
+
         if self.is_valid_callable(value):
             value = value()
-            logger.debug("Process callable resulting type:%s", get_type(value))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Process callable resulting type:%s", get_type(value))
 
         if kwargs:
-            if "key" in kwargs:
-                # since None and ... are valid keys
-                return self.serialize_with_fork(value=value, key=kwargs["key"])
-            raise ValueError("Malformed structure of kwargs. Only `key` accepted")
+            # since None and ... are valid keys
+            return self.serialize_with_fork(value=value, key=kwargs["key"])
 
         return self.apply_callback(value=value)
 
@@ -230,23 +314,73 @@ class Serializer:
         :return: serialized value
         :raises: IsNotSerializable
         """
+        return self.get_callback(value)(value)
+
+    def get_callback(self, value):
+        """
+        :return: callback serializing the value
+        :raises: IsNotSerializable
+        """
+        try:
+            return self.callbacks_by_type[type(value)]
+        except KeyError:
+            return self.resolve_callback(value)
+
+    def resolve_callback(self, value):
+        """
+        Find the first callback in serialize_types matching the value
+        and remember it for the type of the value
+        :return: callback
+        :raises: IsNotSerializable
+        """
         for types, callback in self.serialize_types:
             if isinstance(value, types):
-                return callback(value)
+                self.callbacks_by_type[type(value)] = callback
+                return callback
         raise IsNotSerializable(f"Unserializable type:{get_type(value)} value:{value}")
 
     def serialize_with_fork(self, value, key):
-        serializer = self
-        if self.is_forkable(value):
-            serializer = self.fork(key=key)
-
-        return serializer.apply_callback(value)
+        if not self.is_forkable(value):
+            return self.apply_callback(value)
+
+        # Same as serializing with self.fork(key) but without
+        # creating a new serializer: the forked schema is swapped in
+        schema, depth = self.schema, self.serialization_depth
+        self.schema = schema.fork(key=key)
+        self.set_serialization_depth(depth + 1)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fork serializer for key:%s", key)
+        try:
+            return self.apply_callback(value)
+        finally:
+            self.schema = schema
+            self.set_serialization_depth(depth)
 
     def serialize_iter(self, value: Iterable) -> list:
+        simple_types = self.simple_types
+        if type(value) in _REITERABLE_COLLECTIONS and simple_types.issuperset(
+            map(type, value)
+        ):
+            return list(value)  # Nothing to serialize inside
+
         res = []
+        # Fields of the last serialized model, reused while the following
+        # items have the same type and the same serialization settings
+        model_type = model_settings = model_fields = None
         for v in value:
+            value_type = type(v)
+            if value_type in simple_types:
+                res.append(v)
+                continue
             try:
-                r = self.serialize(v)
+                if value_type is model_type and get_model_settings(v) == model_settings:
+                    r = self.serialize_model_fields(v, fields=model_fields)
+                elif self.is_plain_model(v):
+                    model_type, model_settings = value_type, get_model_settings(v)
+                    model_fields = self.get_model_fields(v)
+                    r = self.serialize_model_fields(v, fields=model_fields)
+                else:
+                    r = self.serialize(v)
             except (
                 IsNotSerializable
             ):  # FIXME: Why we swallow exception only in iterable?
@@ -257,38 +391,121 @@ class Serializer:
         return res
 
     def serialize_dict(self, value: dict) -> dict:
-        res = {}
-        for k, v in value.items():
-            if self.schema.is_included(k):  # TODO: Skip check if is NOT greedy
-                logger.debug("Serialize key:%s type:%s of dict", k, get_type(v))
-
-                res[k] = self.serialize(value=v, key=k)
-            else:
-                logger.debug("Skip key:%s of dict", k)
-        return res
+        simple_types = self.simple_types
+        serialize = self.serialize
+        is_debug = logger.isEnabledFor(logging.DEBUG)
+        items = value.items()
+
+        if self.schema.includes_all:
+            if is_debug:
+                items = log_dict_items(items)
+            return {
+                k: v if type(v) in simple_types else serialize(value=v, key=k)
+                for k, v in items
+            }
+
+        is_included = self.schema.compile()
+        if is_debug:
+            items = log_dict_items(items, is_included=is_included)
+        return {
+            k: v if type(v) in simple_types else serialize(value=v, key=k)
+            for k, v in items
+            if is_included(k)
+        }
+
+    def is_plain_model(self, value) -> bool:
+        """
+        Determines models that are serialized by serialize_model as is
+        """
+        return (
+            isinstance(value, SerializerMixin)
+            and not self.is_valid_callable(value)
+            and self.get_callback(value) == self.serialize_model
+        )
 
     def serialize_model(self, value) -> dict:
+        return self.serialize_model_fields(value, fields=self.get_model_fields(value))
+
+    def get_model_fields(self, value) -> t.Tuple[t.Tuple[str, attrgetter], ...]:
+        """
+        :return: pairs of key and its getter for the fields that should be serialized
+        """
+        return get_field_getters(self.get_model_keys(value))
+
+    def get_model_keys(self, value) -> t.Tuple[str, ...]:
+        """
+        Updates the schema with rules of the model
+        :return: keys of the model that should be serialized
+        """
         self.schema.update(only=value.serialize_only, extend=value.serialize_rules)
 
-        res = {}
         keys = self.schema.keys
         if self.schema.is_greedy:
-            keys.update(get_serializable_keys(value))
-
-        for k in keys:
-            if self.schema.is_included(key=k):  # TODO: Skip check if is NOT greedy
-                v = getattr(value, k)
-                logger.debug(
-                    "Serialize key:%s type:%s of model:%s",
-                    k,
-                    get_type(v),
-                    get_type(value),
-                )
-                res[k] = self.serialize(value=v, key=k)
-
-            else:
+            serializable_keys = get_serializable_keys(value)
+            keys = serializable_keys.union(keys) if keys else serializable_keys
+
+        included = self.schema.filter_keys(keys)
+        if logger.isEnabledFor(logging.DEBUG):
+            for k in keys - included:
                 logger.debug("Skip key:%s of model:%s", k, get_type(value))
-        return res
+        return tuple(included)
+
+    def serialize_model_fields(self, value, fields) -> dict:
+        serialize = self.serialize
+        # Loaded attributes are read directly bypassing SQLAlchemy descriptors,
+        # the rest (expired, unloaded, properties) are read through the getter
+        loaded = getattr(value, "__dict__", _NO_ATTRIBUTES)
+        items = ((k, loaded[k] if k in loaded else get(value)) for k, get in fields)
+        if logger.isEnabledFor(logging.DEBUG):
+            items = log_model_items(items, model=value)
+
+        return {k: serialize(value=v, key=k) for k, v in items}
+
+
+@functools.lru_cache(maxsize=1024)
+def get_field_getters(
+    keys: t.Tuple[str, ...]
+) -> t.Tuple[t.Tuple[str, attrgetter], ...]:
+    return tuple((k, attrgetter(k)) for k in keys)
+
+
+# The signature check depends only on the function and whether it is bound,
+# so it is computed once per function instead of once per value
+@functools.lru_cache(maxsize=1024)
+def inspect_function(func: FunctionType, is_method: bool) -> bool:
+    # Same as check_argspec but read straight from the code object
+    code = func.__code__
+    if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+        return False
+    if is_method and code.co_argcount == 1 and code.co_varnames[0] == "self":
+        return True
+    return code.co_argcount == 0
+
+
+def inspect_callable(func) -> bool:
+    return check_argspec(
+        inspect.getfullargspec(func), is_method=isinstance(func, MethodType)
+    )
+
+
+def check_argspec(i: inspect.FullArgSpec, is_method: bool) -> bool:
+    if i.args == ["self"] and is_method and not any([i.varargs, i.varkw]):
+        return True
+    return not any([i.args, i.varargs, i.varkw])
+
+
+def identity(value):
+    return value
+
+
+get_enum_value = attrgetter("value")
+
+get_model_settings = attrgetter(
+    "serialize_only",
+    "serialize_rules",
+    "serializable_keys",
+    "auto_serialize_properties",
+)
 
 
 class IsNotSerializable(Exception):
@@ -299,5 +516,45 @@ def get_type(value) -> str:
     return type(value).__name__
 
 
+def log_dict_items(items, is_included=None):
+    for k, v in items:
+        if is_included is None or is_included(k):
+            logger.debug("Serialize key:%s type:%s of dict", k, get_type(v))
+        else:
+            logger.debug("Skip key:%s of dict", k)
+        yield k, v
+
+
+def log_model_items(items, model):
+    for k, v in items:
+        logger.debug(
+            "Serialize key:%s type:%s of model:%s", k, get_type(v), get_type(model)
+        )
+        yield k, v
+
+
 def serialize_collection(iterable: t.Iterable, *args, **kwargs) -> list:
-    return [item.to_dict(*args, **kwargs) for item in iterable]
+    """
+    Same as calling to_dict(*args, **kwargs) of every item
+    but consecutive items with the same options share a serializer
+    """
+    if args:
+        return [item.to_dict(*args, **kwargs) for item in iterable]
+
+    only = kwargs.pop("only", ())
+    rules = kwargs.pop("rules", ())
+    res = []
+    serializer = None
+    for item in iterable:
+        if type(item).to_dict is not SerializerMixin.to_dict:
+            res.append(item.to_dict(only=only, rules=rules, **kwargs))
+            continue
+
+        opts = item.get_serializer_options(**kwargs)
+        if serializer is None or serializer.opts != opts:
+            serializer = Serializer(options=opts)
+        else:
+            serializer.schema = Schema()  # Schema is updated by every call
+
+        res.append(serializer(item, only=only, extend=rules))
+    return res
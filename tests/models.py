@@ -94,6 +94,31 @@ class RecursiveModel(Base, SerializerMixin):
     children = relationship("RecursiveModel")
 
 
+# Models with different schemas to be serialized under the same key
+class OnlyIdModel(Base, SerializerMixin):
+    __tablename__ = "only_id_model"
+    serialize_only = ("id",)
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(256), default="some name")
+
+
+class OnlyNameModel(Base, SerializerMixin):
+    __tablename__ = "only_name_model"
+    serialize_only = ("name",)
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(256), default="some name")
+
+
+class ExcludeNameModel(Base, SerializerMixin):
+    __tablename__ = "exclude_name_model"
+    serialize_rules = ("-name",)
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(256), default="some name")
+
+
 # Custom serializer
 CUSTOM_TZINFO = pytz.timezone("Asia/Krasnoyarsk")
 CUSTOM_DATE_FORMAT = "%s"  # Unixtimestamp (seconds)
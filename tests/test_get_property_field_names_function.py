@@ -9,3 +9,9 @@ def test_get_property_field_names__returns_result(get_instance):
         "prop",
         "prop_with_bytes",
     }
+
+
+def test_get_property_field_names__cached_per_class(get_instance):
+    first = get_instance(FlatModel)
+    second = get_instance(FlatModel)
+    assert get_property_field_names(first) is get_property_field_names(second)
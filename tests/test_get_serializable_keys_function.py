@@ -1,3 +1,10 @@
+import gc
+import weakref
+
+import sqlalchemy as sa
+from sqlalchemy.orm import declarative_base
+
+from sqlalchemy_serializer import SerializerMixin
 from sqlalchemy_serializer.lib.fields import get_serializable_keys
 from tests.models import FlatModel
 
@@ -40,3 +47,23 @@ def test_get_serializable_keys__auto_serialize_propereties(get_instance):
         "prop",
         "prop_with_bytes",
     }
+
+
+def test_get_serializable_keys__cached_per_class(get_instance):
+    first = get_instance(FlatModel)
+    second = get_instance(FlatModel)
+    assert get_serializable_keys(first) is get_serializable_keys(second)
+
+
+def test_get_serializable_keys__cache_does_not_keep_class():
+    base = declarative_base()
+
+    class Temporary(base, SerializerMixin):
+        __tablename__ = "temporary"
+        id = sa.Column(sa.Integer, primary_key=True)
+
+    assert get_serializable_keys(Temporary()) == {"id"}
+    ref = weakref.ref(Temporary)
+    del Temporary, base
+    gc.collect()
+    assert ref() is None
@@ -17,3 +17,9 @@ def test_rule(text, keys, is_negative):
     assert rule.keys == keys
     assert rule.is_negative == is_negative
     assert str(rule) == text
+
+
+def test_rule_get_returns_shared_instance():
+    rule = Rule.get("shared.rule")
+    assert rule is Rule.get("shared.rule")
+    assert rule.keys == ["shared", "rule"]
@@ -186,6 +186,7 @@ def test_is_included_method(args, expected):
     schema = Schema()
     schema.update(**args)
     assert schema.is_included(KEY) == expected
+    assert schema.compile()(KEY) == expected
 
 
 @pytest.mark.parametrize(
@@ -256,3 +257,53 @@ def check_rule(text: str, tree: Tree) -> Tree:
 
 class NoNodeException(Exception):
     pass
+
+
+@pytest.mark.parametrize(
+    "rules, keys",
+    [
+        ({}, set()),
+        ({"extend": ("-key",)}, {"key"}),
+        ({"extend": ("-key.another",)}, set()),
+        ({"extend": ("key", "-key")}, {"key"}),
+        ({"extend": ("-key", "-another", "third")}, {"key", "another"}),
+    ],
+)
+def test_excluded_keys_property(rules, keys):
+    schema = Schema()
+    schema.update(**rules)
+    assert schema.excluded_keys == keys
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        {},
+        {"extend": ("-key",)},
+        {"extend": ("key", "-key.another", "-another")},
+        {"only": ("key",)},
+        {"only": ("key.another", "-another")},
+        {"only": ("-key",), "extend": ("another",)},
+    ],
+)
+def test_filter_keys_method(rules):
+    keys = {"key", "another", "third"}
+    schema = Schema()
+    schema.update(**rules)
+    assert schema.filter_keys(keys) == {k for k in keys if schema.is_included(k)}
+
+
+@pytest.mark.parametrize(
+    "rules, expected",
+    [
+        ({}, True),
+        ({"extend": ("key",)}, True),
+        ({"extend": ("-key.another",)}, True),
+        ({"extend": ("-key",)}, False),
+        ({"only": ("key",)}, False),
+    ],
+)
+def test_includes_all_property(rules, expected):
+    schema = Schema()
+    schema.update(**rules)
+    assert schema.includes_all is expected
@@ -1,5 +1,5 @@
 from sqlalchemy_serializer.serializer import serialize_collection
-from .models import FlatModel
+from .models import CustomSerializerModel, FlatModel
 
 
 def test_serialize_collection__success(get_instance):
@@ -8,3 +8,15 @@ def test_serialize_collection__success(get_instance):
     assert isinstance(result, list)
     assert len(result) == 3
     assert all(list(item.keys()) == ["id"] for item in result)
+
+
+def test_serialize_collection__same_as_to_dict(get_instance):
+    iterable = [
+        get_instance(FlatModel),
+        get_instance(FlatModel),
+        get_instance(CustomSerializerModel),
+        get_instance(FlatModel),
+    ]
+    kwargs = dict(rules=("-date",), datetime_format="%Y")
+    result = serialize_collection(iterable, **kwargs)
+    assert result == [item.to_dict(**kwargs) for item in iterable]
@@ -11,6 +11,7 @@ def test_fork_with_key(mocker, get_serializer):
 
     assert isinstance(result, Serializer)
     assert result.opts == serializer.opts
+    assert result.opts is serializer.opts  # Options are shared, not rebuilt
     schema.fork.assert_called_once_with(key=key)
 
 
@@ -24,3 +25,17 @@ def test_fork_logger(mocker, get_serializer):
     serializer.fork(key=key)
 
     mocked_logger.debug.assert_called_once_with("Fork serializer for key:%s", key)
+
+
+def test_serialize_with_fork_restores_schema_on_error(get_serializer):
+    serializer = get_serializer()
+    serializer.schema.update(extend=("-nested.skip",))
+    schema = serializer.schema
+
+    result = serializer.serialize_iter(
+        [{"nested": {"bad": object()}}, {"nested": {"key": 1, "skip": 2}}]
+    )
+
+    assert result == [{"nested": {"key": 1}}]
+    assert serializer.schema is schema
+    assert serializer.serialization_depth == 0
@@ -0,0 +1,33 @@
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from .models import FlatModel
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ([1, 2], True),
+        ((1, 2), True),
+        ({1, 2}, True),
+        (frozenset((1, 2)), True),
+        ({"key": 1}, True),
+        ((i for i in range(2)), True),
+        (FlatModel(), True),
+        ("string", False),
+        (b"bytes", True),
+        (1, False),
+        (None, False),
+        (Decimal("1.1"), False),
+        (datetime.now(), False),
+        (uuid4(), False),
+    ],
+)
+def test_is_forkable(get_serializer, value, expected):
+    serializer = get_serializer()
+    assert serializer.is_forkable(value) is expected
+    # Cached result should be the same
+    assert serializer.is_forkable(value) is expected
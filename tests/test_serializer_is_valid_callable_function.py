@@ -0,0 +1,53 @@
+import pytest
+
+from sqlalchemy_serializer.serializer import Serializer
+
+
+class Some:
+    def method(self):
+        return "method"
+
+    def method_with_args(self, arg):
+        return arg
+
+    def method_with_varargs(self, *args):
+        return args
+
+    def __call__(self):
+        return "instance"
+
+
+def function():
+    return "function"
+
+
+def function_with_args(arg):
+    return arg
+
+
+def function_with_kwargs(**kwargs):
+    return kwargs
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (function, True),
+        (lambda: 1, True),
+        (Some().method, True),
+        (Some, True),
+        (Some(), False),
+        (function_with_args, False),
+        (function_with_kwargs, False),
+        (Some().method_with_args, False),
+        (Some().method_with_varargs, False),
+        (Some.method, False),
+        (1, False),
+        ("string", False),
+        (None, False),
+    ],
+)
+def test_is_valid_callable(value, expected):
+    assert Serializer.is_valid_callable(value) is expected
+    # Cached result should be the same
+    assert Serializer.is_valid_callable(value) is expected
@@ -1,6 +1,11 @@
 from decimal import Decimal
+import logging
 import pytest
 
+from sqlalchemy_serializer.lib.schema import Schema
+
+from .models import ExcludeNameModel, OnlyIdModel, OnlyNameModel
+
 
 @pytest.fixture
 def test_dict():
@@ -52,3 +57,64 @@ def test_serializer_serialize_dict__fork_success(
     serializer.schema.update(only=only)
     result = serializer.serialize_dict(test_dict)
     assert result == expected
+
+
+def test_serializer_serialize_dict__custom_atomic_type(get_serializer):
+    serializer = get_serializer(serialize_types=((str, lambda _: "custom"),))
+    result = serializer.serialize_dict({"str": "value", "int": 1, "list": ["value"]})
+    assert result == {"str": "custom", "int": 1, "list": ["custom"]}
+
+
+@pytest.mark.parametrize(
+    "first, expected",
+    [
+        (OnlyIdModel(id=1, name="first"), {"id": 1}),
+        (ExcludeNameModel(id=1, name="first"), {"id": 1}),
+    ],
+)
+def test_serializer_serialize_dict__sibling_models_do_not_share_rules(
+    get_serializer, first, expected
+):
+    serializer = get_serializer()
+    second = OnlyNameModel(id=2, name="second")
+    result = serializer([{"model": first}, {"model": second}])
+    assert result == [{"model": expected}, {"model": {"name": "second"}}]
+
+
+def test_serializer_serialize_dict__logs_keys(mocker, get_serializer):
+    mocked_logger = mocker.patch("sqlalchemy_serializer.serializer.logger")
+    serializer = get_serializer()
+    serializer.schema.update(extend=("-skip",))
+    assert serializer.serialize_dict({"key": 1, "skip": 2}) == {"key": 1}
+    mocked_logger.debug.assert_any_call(
+        "Serialize key:%s type:%s of dict", "key", "int"
+    )
+    mocked_logger.debug.assert_any_call("Skip key:%s of dict", "skip")
+
+
+@pytest.fixture
+def debug_disabled():
+    logger = logging.getLogger("serializer")
+    level = logger.level
+    logger.setLevel(logging.WARNING)
+    yield
+    logger.setLevel(level)
+
+
+@pytest.mark.parametrize(
+    "rules, expected, is_compiled",
+    [
+        ({}, {"key": 1, "nested": {"key": 2}}, False),
+        ({"extend": ("-key",)}, {"nested": {"key": 2}}, True),
+        ({"only": ("nested",)}, {"nested": {"key": 2}}, True),
+    ],
+)
+def test_serializer_serialize_dict__debug_disabled(
+    mocker, debug_disabled, get_serializer, rules, expected, is_compiled
+):
+    compile_spy = mocker.spy(Schema, "compile")
+    serializer = get_serializer()
+    serializer.schema.update(**rules)
+    result = serializer.serialize_dict({"key": 1, "nested": {"key": 2}})
+    assert result == expected
+    assert compile_spy.called is is_compiled
@@ -0,0 +1,32 @@
+from .models import FlatModel
+
+
+def test_serializer_serialize_iter__simple_values(get_serializer):
+    serializer = get_serializer()
+    assert serializer.serialize_iter((1, "str", None)) == [1, "str", None]
+
+
+def test_serializer_serialize_iter__same_models(get_serializer):
+    serializer = get_serializer()
+    result = serializer.serialize_iter([FlatModel(id=1), FlatModel(id=2)])
+    assert [r["id"] for r in result] == [1, 2]
+    assert result[0].keys() == result[1].keys()
+
+
+def test_serializer_serialize_iter__model_rules(get_serializer):
+    serializer = get_serializer()
+    first, second = FlatModel(id=1), FlatModel(id=2)
+    second.serialize_rules = ("-string",)
+    result = serializer.serialize_iter([first, second])
+    assert "string" in result[0]
+    assert "string" not in result[1]
+    assert result[1]["id"] == 2
+
+
+def test_serializer_serialize_iter__model_serializable_keys(get_serializer):
+    serializer = get_serializer()
+    first, second = FlatModel(id=1), FlatModel(id=2)
+    second.serializable_keys = ("id",)
+    result = serializer.serialize_iter([first, second])
+    assert "string" in result[0]
+    assert result[1] == {"id": 2}
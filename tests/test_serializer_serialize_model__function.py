@@ -28,3 +28,14 @@ def test_serializer_serialize_model__fork_success(
     serializer.schema.update(only=only)
     result = serializer.serialize_model(test_model)
     assert result == expected
+
+
+def test_serializer_serialize_model__expired_attributes(
+    get_serializer, get_instance, session
+):
+    model = get_instance(FlatModel)
+    session.expire(model)
+    serializer = get_serializer()
+    serializer.schema.update(only=("id", "string"))
+    result = serializer.serialize_model(model)
+    assert result == {"id": model.id, "string": "Some string with"}